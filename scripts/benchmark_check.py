@@ -6,7 +6,6 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import statistics
 import subprocess
 import sys
 from datetime import UTC, datetime
@@ -14,6 +13,8 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 
@@ -21,27 +22,60 @@ SRC_PATH = PROJECT_ROOT / "src"
 def _summary(values: list[float]) -> dict[str, float]:
     if not values:
         raise ValueError("No benchmark values were collected")
-    p95 = values[0]
-    if len(values) > 1:
-        p95 = statistics.quantiles(values, n=20, method="inclusive")[18]
+    arr = np.asarray(values, dtype=np.float64)
+    # Linear interpolation matches the previous statistics.quantiles(method="inclusive").
     payload: dict[str, float] = {
-        "min": min(values),
-        "max": max(values),
-        "mean": statistics.fmean(values),
-        "median": statistics.median(values),
-        "p95": p95,
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        "mean": float(arr.mean()),
+        "median": float(np.median(arr)),
+        "p95": float(np.percentile(arr, 95)),
     }
     if len(values) > 1:
-        payload["stdev"] = statistics.stdev(values)
+        payload["stdev"] = float(arr.std(ddof=1))
     return payload
 
 
+def _run_in_process(store_path: Path, *, strict_stale: bool, spec_cache: bool) -> dict[str, Any]:
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
+    from xzarrguard.integrity import check_store
+
+    wall_start = perf_counter()
+    report = check_store(
+        store_path,
+        strict_stale_manifest=strict_stale,
+        timing=True,
+        use_spec_cache=spec_cache,
+    )
+    wall_s = perf_counter() - wall_start
+    if report.timing is None:
+        raise RuntimeError("check_store did not return timing details")
+
+    timing = report.timing
+    return {
+        "exit_code": 0 if report.ok else 1,
+        "ok": report.ok,
+        "wall_s": wall_s,
+        "reported_total_s": timing.total_s,
+        "scan_specs_s": timing.scan_specs_s,
+        "manifest_s": timing.manifest_s,
+        "chunk_scan_s": timing.chunk_scan_s,
+        "exists_calls": timing.exists_calls,
+    }
+
+
 def _run_once(
     store_path: Path,
     *,
     python_bin: str,
     strict_stale: bool,
+    spec_cache: bool = False,
+    in_process: bool = True,
 ) -> dict[str, Any]:
+    if in_process:
+        return _run_in_process(store_path, strict_stale=strict_stale, spec_cache=spec_cache)
+
     cmd = [
         python_bin,
         "-m",
@@ -53,6 +87,8 @@ def _run_once(
     ]
     if strict_stale:
         cmd.append("--strict-stale")
+    if spec_cache:
+        cmd.append("--spec-cache")
 
     env = os.environ.copy()
     existing = env.get("PYTHONPATH")
@@ -113,16 +149,29 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         default=1,
         help="Number of warmup runs (default: 1)",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run each check via the CLI in a fresh interpreter to include cold-start cost",
+    )
     parser.add_argument(
         "--python",
         default=sys.executable,
-        help="Python interpreter used for benchmark runs (default: current interpreter)",
+        help="Python interpreter used with --subprocess (default: current interpreter)",
     )
     parser.add_argument(
         "--strict-stale",
         action="store_true",
         help="Pass --strict-stale to check runs",
     )
+    parser.add_argument(
+        "--spec-cache",
+        action="store_true",
+        help=(
+            "Reuse cached array metadata between runs; by default every run performs "
+            "a full metadata scan"
+        ),
+    )
     parser.add_argument(
         "--out",
         type=Path,
@@ -149,12 +198,24 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     for index in range(args.warmup):
-        _run_once(store_path, python_bin=args.python, strict_stale=args.strict_stale)
+        _run_once(
+            store_path,
+            python_bin=args.python,
+            strict_stale=args.strict_stale,
+            spec_cache=args.spec_cache,
+            in_process=not args.subprocess,
+        )
         print(f"warmup {index + 1}/{args.warmup} complete")
 
     runs: list[dict[str, Any]] = []
     for index in range(args.runs):
-        result = _run_once(store_path, python_bin=args.python, strict_stale=args.strict_stale)
+        result = _run_once(
+            store_path,
+            python_bin=args.python,
+            strict_stale=args.strict_stale,
+            spec_cache=args.spec_cache,
+            in_process=not args.subprocess,
+        )
         runs.append(result)
         print(
             f"run {index + 1}/{args.runs}: "
@@ -174,10 +235,12 @@ def main(argv: list[str] | None = None) -> int:
         "schema_version": 1,
         "timestamp_utc": datetime.now(UTC).isoformat(),
         "store_path": str(store_path),
-        "python": args.python,
+        "mode": "subprocess" if args.subprocess else "in_process",
+        "python": args.python if args.subprocess else sys.executable,
         "runs": args.runs,
         "warmup": args.warmup,
         "strict_stale": bool(args.strict_stale),
+        "spec_cache": bool(args.spec_cache),
         "summary": summary,
         "per_run": runs,
     }
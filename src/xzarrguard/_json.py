@@ -0,0 +1,48 @@
+"""JSON encoding and decoding with optional orjson acceleration."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None
+
+# orjson decodes integers beyond 64 bits as floats; any digit run this long may be
+# one, so such documents go to the stdlib decoder, which keeps them exact.
+_LONG_DIGIT_RUN = re.compile(rb"\d{19,}")
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when installed and the result is identical to the stdlib's."""
+
+    if orjson is not None and _LONG_DIGIT_RUN.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens zarr writes for non-finite
+            # attribute and fill values; the stdlib decoder accepts them.
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize with sorted keys and a trailing newline, ready for ``write_bytes``."""
+
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects integers outside 64 bits; the stdlib encoder does not.
+            pass
+    text = json.dumps(obj, indent=2 if indent else None, sort_keys=True)
+    return (text + "\n").encode("utf-8")
+
+
+__all__ = ["dumps", "loads"]
@@ -29,11 +29,27 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fail when manifest contains entries for chunks that exist",
     )
+    check.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Stop at the first failure instead of reporting every problem",
+    )
+    check.add_argument(
+        "--spec-cache",
+        action="store_true",
+        help="Cache parsed array metadata in <store>/.xzarrguard for later checks",
+    )
 
     create = subparsers.add_parser("create", help="Create integrity-aware store")
     create.add_argument("source_zarr", help="Source Zarr store readable by xarray")
     create.add_argument("target_store", help="Target Zarr store path")
     create.add_argument("--no-data", help="JSON mapping of variable to no-data chunk coordinates")
+    create.add_argument(
+        "--manifest-format",
+        choices=["json", "binary"],
+        default="json",
+        help="On-disk format of no-data manifests (default: json)",
+    )
     create.add_argument("--overwrite", action="store_true", help="Overwrite target if it exists")
 
     return parser
@@ -45,6 +61,8 @@ def _run_check(args: argparse.Namespace) -> int:
             args.store_path,
             strict_stale_manifest=args.strict_stale,
             timing=args.timing,
+            fast_fail=args.fast_fail,
+            use_spec_cache=args.spec_cache,
         )
     except Exception as exc:  # pragma: no cover - defensive CLI guard
         print(f"error: {exc}", file=sys.stderr)
@@ -92,6 +110,7 @@ def _run_create(args: argparse.Namespace) -> int:
             dataset,
             args.target_store,
             no_data_chunks=no_data,
+            manifest_format=args.manifest_format,
             overwrite=args.overwrite,
         )
     except Exception as exc:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+import os
 import shutil
 from collections.abc import Iterable, Mapping
 from pathlib import Path
@@ -10,8 +11,14 @@ from pathlib import Path
 import xarray as xr
 
 from .integrity import check_store
-from .layout import chunk_key, chunk_path, coord_in_bounds, scan_array_specs
-from .manifest import write_variable_manifest
+from .layout import (
+    chunk_fspath,
+    chunk_key,
+    coord_in_bounds,
+    scan_array_specs,
+    scan_existing_chunk_keys,
+)
+from .manifest import write_variable_manifest, write_variable_manifest_binary
 from .models import ChunkRef, CreateReport
 
 
@@ -43,14 +50,19 @@ def _write_dataset(dataset: xr.Dataset, store_path: Path) -> None:
     dataset.to_zarr(**kwargs)
 
 
-def _delete_chunk_file(chunk_file: Path, array_root: Path) -> None:
-    if not chunk_file.exists():
+def _delete_chunk_file(chunk_file: str, array_root: str) -> None:
+    try:
+        os.unlink(chunk_file)
+    except FileNotFoundError:
         return
-    chunk_file.unlink()
-    current = chunk_file.parent
-    while current != array_root and current.exists() and not any(current.iterdir()):
-        current.rmdir()
-        current = current.parent
+    current = os.path.dirname(chunk_file)
+    while current != array_root:
+        try:
+            os.rmdir(current)
+        except OSError:
+            # Directory still holds other chunks.
+            return
+        current = os.path.dirname(current)
 
 
 def create_store(
@@ -59,12 +71,15 @@ def create_store(
     *,
     no_data_chunks: Mapping[str, Iterable[Iterable[int]]] | None = None,
     no_data_strategy: str = "manifest",
+    manifest_format: str = "json",
     overwrite: bool = False,
 ) -> CreateReport:
     """Create a Zarr v3 store with explicit no-data policy."""
 
     if no_data_strategy not in {"manifest", "empty_chunks"}:
         raise ValueError("no_data_strategy must be 'manifest' or 'empty_chunks'")
+    if manifest_format not in {"json", "binary"}:
+        raise ValueError("manifest_format must be 'json' or 'binary'")
 
     store = Path(store_path)
     if store.exists():
@@ -86,24 +101,33 @@ def create_store(
 
     for variable, coords in normalized.items():
         spec = specs[variable]
+        array_root = spec.fspath
         refs: list[ChunkRef] = []
         removed: list[ChunkRef] = []
+        existing_keys = (
+            scan_existing_chunk_keys(spec) if no_data_strategy == "empty_chunks" else set()
+        )
         for coord in coords:
             if not coord_in_bounds(spec, coord):
                 raise ValueError(f"Chunk coord {coord} out of bounds for variable {variable}")
             ref = ChunkRef(coord=coord, key=chunk_key(spec, coord))
             refs.append(ref)
             if no_data_strategy == "manifest":
-                _delete_chunk_file(chunk_path(spec, coord), spec.path)
+                _delete_chunk_file(chunk_fspath(spec, coord), array_root)
                 removed.append(ref)
-            elif not chunk_path(spec, coord).exists():
+            elif ref.key not in existing_keys:
                 raise RuntimeError(
                     "Expected chunk file missing after write_empty_chunks=True: "
                     f"{variable}:{coord}"
                 )
 
         if no_data_strategy == "manifest":
-            manifest_file = write_variable_manifest(store, variable, refs)
+            if manifest_format == "binary":
+                manifest_file = write_variable_manifest_binary(
+                    store, variable, refs, ndim=len(spec.shape)
+                )
+            else:
+                manifest_file = write_variable_manifest(store, variable, refs)
             report.manifests_written.append(str(manifest_file))
             report.removed_chunks[variable] = removed
 
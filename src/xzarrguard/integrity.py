@@ -2,25 +2,158 @@
 
 from __future__ import annotations
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import perf_counter
 
-from .layout import chunk_key, chunk_path, coord_in_bounds, expected_chunk_coords, scan_array_specs
+import numpy as np
+
+from .layout import (
+    ArraySpec,
+    chunk_coord_from_index,
+    chunk_keys_bulk,
+    chunk_linear_indices,
+    coord_in_bounds,
+    coords_in_bounds,
+    expected_chunk_keys,
+    scan_array_specs,
+    scan_existing_chunk_keys,
+)
 from .manifest import load_variable_manifest
 from .models import ChunkRef, IntegrityReport, IntegrityTiming, VariableIntegrity, VariableTiming
 
+_MAX_WORKERS = 32
+
+
+def _check_variable(
+    store: Path,
+    spec: ArraySpec,
+    *,
+    strict_stale_manifest: bool,
+    timing: bool,
+    fast_fail: bool,
+) -> tuple[VariableIntegrity, VariableTiming | None]:
+    var_timing = VariableTiming() if timing else None
+
+    manifest_load_start = perf_counter() if var_timing is not None else 0.0
+    has_manifest, manifest_refs = load_variable_manifest(store, spec.name, spec=spec)
+    if var_timing is not None:
+        var_timing.manifest_load_s = perf_counter() - manifest_load_start
+
+    variable = VariableIntegrity(
+        name=spec.name,
+        expected_chunks=0,
+        has_manifest=has_manifest,
+    )
+
+    manifest_validate_start = perf_counter() if var_timing is not None else 0.0
+    rank = len(spec.counts)
+    positions = [pos for pos, ref in enumerate(manifest_refs) if len(ref.coord) == rank]
+    try:
+        candidate_coords = np.array([manifest_refs[pos].coord for pos in positions], dtype=np.int64)
+    except OverflowError:
+        # Only coordinates far outside any chunk grid overflow int64.
+        positions = [pos for pos in positions if coord_in_bounds(spec, manifest_refs[pos].coord)]
+        candidate_coords = np.array([manifest_refs[pos].coord for pos in positions], dtype=np.int64)
+    candidate_coords = candidate_coords.reshape(len(positions), rank)
+    mask = coords_in_bounds(spec, candidate_coords)
+    manifest_coords = candidate_coords[mask]
+    in_bounds_flags = np.zeros(len(manifest_refs), dtype=bool)
+    in_bounds_flags[np.asarray(positions, dtype=np.intp)[mask]] = True
+    in_bounds: list[ChunkRef] = []
+    for ref, flag in zip(manifest_refs, in_bounds_flags.tolist(), strict=True):
+        if flag:
+            in_bounds.append(ref)
+        else:
+            variable.manifest_out_of_bounds.append(ref)
+
+    # A chunk's C-order linear index is also its position in expected_chunk_keys().
+    valid_manifest: frozenset[int] = frozenset()
+    if in_bounds:
+        expected_keys = chunk_keys_bulk(spec, manifest_coords).tolist()
+        indices = chunk_linear_indices(spec, manifest_coords).tolist()
+        valid_indices: list[int] = []
+        for ref, expected_key, index in zip(in_bounds, expected_keys, indices, strict=True):
+            if ref.key != expected_key:
+                variable.manifest_key_mismatch.append(ref)
+            else:
+                valid_indices.append(index)
+        valid_manifest = frozenset(valid_indices)
+
+    if var_timing is not None:
+        var_timing.manifest_validate_s = perf_counter() - manifest_validate_start
+
+    chunk_scan_start = perf_counter() if var_timing is not None else 0.0
+    listed_dirs: list[str] = []
+    existing_keys = scan_existing_chunk_keys(spec, listed_dirs)
+    keys = expected_chunk_keys(spec)
+    variable.expected_chunks = math.prod(spec.counts)
+    add_missing_allowed = variable.missing_allowed.append
+    add_missing_unexpected = variable.missing_unexpected.append
+    add_stale_manifest = variable.stale_manifest.append
+    if not valid_manifest:
+        for index, key in enumerate(keys):
+            if key not in existing_keys:
+                add_missing_unexpected(ChunkRef(coord=chunk_coord_from_index(spec, index), key=key))
+                if fast_fail:
+                    break
+    else:
+        for index, key in enumerate(keys):
+            if key not in existing_keys:
+                ref = ChunkRef(coord=chunk_coord_from_index(spec, index), key=key)
+                if index in valid_manifest:
+                    add_missing_allowed(ref)
+                else:
+                    add_missing_unexpected(ref)
+                    if fast_fail:
+                        break
+        for index in sorted(valid_manifest):
+            coord = chunk_coord_from_index(spec, index)
+            key = spec.encoder(coord)
+            if key in existing_keys:
+                add_stale_manifest(ChunkRef(coord=coord, key=key))
+
+    if var_timing is not None:
+        var_timing.chunk_scan_s = perf_counter() - chunk_scan_start
+        var_timing.expected_chunks = variable.expected_chunks
+        var_timing.missing_chunks = len(variable.missing_allowed) + len(variable.missing_unexpected)
+        var_timing.exists_calls = len(listed_dirs)
+
+    variable.ok = not variable.missing_unexpected
+    if variable.manifest_key_mismatch or variable.manifest_out_of_bounds:
+        variable.ok = False
+    if strict_stale_manifest and variable.stale_manifest:
+        variable.ok = False
+
+    return variable, var_timing
+
 
 def check_store(
     store_path: str | Path,
     *,
     strict_stale_manifest: bool = False,
     timing: bool = False,
+    fast_fail: bool = False,
+    use_spec_cache: bool = False,
 ) -> IntegrityReport:
-    """Validate completeness of a Zarr v3 store."""
+    """Validate completeness of a Zarr v3 store.
+
+    With ``fast_fail``, variables are checked one at a time in name order and checking
+    stops at the first unexpectedly missing chunk, or after the first variable that
+    fails, so the report only lists the variables checked so far.
+
+    With ``use_spec_cache``, parsed array metadata is cached in
+    ``.xzarrguard/specs.cache.json`` inside the store and reused by later checks.
+    """
 
     total_start = perf_counter() if timing else 0.0
     store = Path(store_path)
-    report = IntegrityReport(store_path=str(store), strict_stale_manifest=strict_stale_manifest)
+    report = IntegrityReport(
+        store_path=str(store),
+        strict_stale_manifest=strict_stale_manifest,
+        fast_fail=fast_fail,
+    )
     timing_data = IntegrityTiming() if timing else None
 
     def _finish() -> IntegrityReport:
@@ -40,7 +173,7 @@ def check_store(
 
     scan_start = perf_counter() if timing_data is not None else 0.0
     try:
-        specs = scan_array_specs(store)
+        specs = scan_array_specs(store, use_cache=use_spec_cache)
     except ValueError as exc:
         report.ok = False
         report.errors.append(str(exc))
@@ -48,68 +181,33 @@ def check_store(
     if timing_data is not None:
         timing_data.scan_specs_s = perf_counter() - scan_start
 
-    for spec in specs:
-        var_timing = VariableTiming() if timing_data is not None else None
-
-        manifest_load_start = perf_counter() if var_timing is not None else 0.0
-        has_manifest, manifest_refs = load_variable_manifest(store, spec.name)
-        if var_timing is not None:
-            var_timing.manifest_load_s = perf_counter() - manifest_load_start
-
-        variable = VariableIntegrity(
-            name=spec.name,
-            expected_chunks=0,
-            has_manifest=has_manifest,
+    def _check(spec: ArraySpec) -> tuple[VariableIntegrity, VariableTiming | None]:
+        return _check_variable(
+            store,
+            spec,
+            strict_stale_manifest=strict_stale_manifest,
+            timing=timing_data is not None,
+            fast_fail=fast_fail,
         )
 
-        manifest_validate_start = perf_counter() if var_timing is not None else 0.0
-        valid_manifest: dict[tuple[int, ...], ChunkRef] = {}
-        for ref in manifest_refs:
-            if not coord_in_bounds(spec, ref.coord):
-                variable.manifest_out_of_bounds.append(ref)
-                continue
-            expected_key = chunk_key(spec, ref.coord)
-            if ref.key != expected_key:
-                variable.manifest_key_mismatch.append(ref)
-                continue
-            valid_manifest[ref.coord] = ref
-
-        if var_timing is not None:
-            var_timing.manifest_validate_s = perf_counter() - manifest_validate_start
-
-        chunk_scan_start = perf_counter() if var_timing is not None else 0.0
-        for coord in expected_chunk_coords(spec):
-            variable.expected_chunks += 1
-            key = chunk_key(spec, coord)
-            exists = chunk_path(spec, coord).exists()
-            ref = ChunkRef(coord=coord, key=key)
-
-            if not exists and coord in valid_manifest:
-                variable.missing_allowed.append(ref)
-            elif not exists:
-                variable.missing_unexpected.append(ref)
-            elif coord in valid_manifest:
-                variable.stale_manifest.append(ref)
-
-        if var_timing is not None:
-            var_timing.chunk_scan_s = perf_counter() - chunk_scan_start
-            var_timing.expected_chunks = variable.expected_chunks
-            var_timing.missing_chunks = len(variable.missing_allowed) + len(
-                variable.missing_unexpected
-            )
-
-        variable.ok = not variable.missing_unexpected
-        if variable.manifest_key_mismatch or variable.manifest_out_of_bounds:
-            variable.ok = False
-        if strict_stale_manifest and variable.stale_manifest:
-            variable.ok = False
-
-        report.variables[spec.name] = variable
+    results: list[tuple[VariableIntegrity, VariableTiming | None]] = []
+    if fast_fail:
+        # Serial, so the first failure deterministically ends the check.
+        for spec in specs:
+            results.append(_check(spec))
+            if not results[-1][0].ok:
+                break
+    elif specs:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(specs))) as executor:
+            results = list(executor.map(_check, specs))
+
+    for variable, var_timing in results:
+        report.variables[variable.name] = variable
         if timing_data is not None and var_timing is not None:
-            timing_data.variables[spec.name] = var_timing
+            timing_data.variables[variable.name] = var_timing
             timing_data.manifest_s += var_timing.manifest_load_s + var_timing.manifest_validate_s
             timing_data.chunk_scan_s += var_timing.chunk_scan_s
-            timing_data.exists_calls += variable.expected_chunks
+            timing_data.exists_calls += var_timing.exists_calls
 
     report.ok = not report.errors and all(variable.ok for variable in report.variables.values())
     return _finish()
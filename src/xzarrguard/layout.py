@@ -2,13 +2,35 @@
 
 from __future__ import annotations
 
-import json
-import math
-from dataclasses import dataclass
+import os
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from itertools import product
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from ._json import dumps as json_dumps
+from ._json import loads as json_loads
+
+SPEC_CACHE_SCHEMA_VERSION = 2
+SPEC_CACHE_PATH = Path(".xzarrguard") / "specs.cache.json"
+_SPEC_MEMO_SIZE = 32
+_MAX_READ_WORKERS = 32
+_DEFAULT_CHUNK_KEY_ENCODING: dict[str, Any] = {
+    "name": "default",
+    "configuration": {"separator": "/"},
+}
+# (zarr.json stats, None if absent; group child-directory names), by relative path
+_Sources = tuple[dict[str, list[int] | None], dict[str, list[str]]]
+# (given store path, absolute store path) -> (sources, specs)
+_spec_memo: dict[tuple[str, str], tuple[_Sources, list[ArraySpec]]] = {}
+
 
 @dataclass(frozen=True, slots=True)
 class ArraySpec:
@@ -20,6 +42,60 @@ class ArraySpec:
     chunk_shape: tuple[int, ...]
     chunk_key_encoding: str
     separator: str
+    counts: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    encoder: Callable[[tuple[int, ...]], str] = field(init=False, repr=False, compare=False)
+    fspath: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.shape) != len(self.chunk_shape):
+            raise ValueError(f"Shape/chunk rank mismatch for {self.name}")
+        counts = tuple(
+            -(-size // chunk) for size, chunk in zip(self.shape, self.chunk_shape, strict=True)
+        )
+        object.__setattr__(self, "counts", counts)
+        object.__setattr__(self, "encoder", _key_encoder(self))
+        object.__setattr__(self, "fspath", os.fspath(self.path))
+
+    def __reduce__(self) -> tuple[type[ArraySpec], tuple[Any, ...]]:
+        # The encoder is a closure and cannot be pickled; rebuild from the init fields.
+        return (
+            ArraySpec,
+            (
+                self.name,
+                self.path,
+                self.shape,
+                self.chunk_shape,
+                self.chunk_key_encoding,
+                self.separator,
+            ),
+        )
+
+
+def _key_encoder(spec: ArraySpec) -> Callable[[tuple[int, ...]], str]:
+    """Return a chunk-key encoder specialized for the spec's encoding, separator and rank."""
+
+    separator = spec.separator
+    if spec.chunk_key_encoding == "default":
+        prefix, scalar_key = f"c{separator}", "c"
+    elif spec.chunk_key_encoding == "v2":
+        prefix, scalar_key = "", "0"
+    else:
+        raise ValueError(
+            f"Unsupported chunk_key_encoding '{spec.chunk_key_encoding}' for {spec.name}"
+        )
+
+    rank = len(spec.shape)
+    escaped = separator.replace("%", "%%")
+    template = prefix.replace("%", "%%") + escaped.join(["%d"] * rank) if rank else scalar_key
+    join = separator.join
+
+    def encode(coord: tuple[int, ...]) -> str:
+        # %-formatting treats any non-tuple (e.g. a list) as a single argument.
+        if type(coord) is tuple and len(coord) == rank:
+            return template % coord
+        return prefix + join(map(str, coord)) if coord else scalar_key
+
+    return encode
 
 
 def _parse_array_spec(
@@ -35,20 +111,17 @@ def _parse_array_spec(
     if payload.get("node_type") != "array":
         return None
 
-    shape = tuple(int(v) for v in payload["shape"])
+    shape = tuple(map(int, payload["shape"]))
     chunk_grid = payload.get("chunk_grid", {})
     if chunk_grid.get("name") != "regular":
         raise ValueError(f"Only regular chunk grids are supported: {source}")
-    chunk_shape = tuple(int(v) for v in chunk_grid["configuration"]["chunk_shape"])
+    chunk_shape = tuple(map(int, chunk_grid["configuration"]["chunk_shape"]))
 
-    encoding = payload.get("chunk_key_encoding") or {
-        "name": "default",
-        "configuration": {"separator": "/"},
-    }
-    encoding_name = str(encoding.get("name", "default"))
+    encoding = payload.get("chunk_key_encoding") or _DEFAULT_CHUNK_KEY_ENCODING
+    encoding_name = sys.intern(str(encoding.get("name", "default")))
     config = encoding.get("configuration", {})
     default_separator = "/" if encoding_name == "default" else "."
-    separator = str(config.get("separator", default_separator))
+    separator = sys.intern(str(config.get("separator", default_separator)))
 
     if not array_name:
         rel_dir = array_path.relative_to(store_path)
@@ -64,12 +137,14 @@ def _parse_array_spec(
     )
 
 
-def _scan_from_consolidated_metadata(store_path: Path) -> list[ArraySpec]:
+def _scan_from_consolidated_metadata(
+    store_path: Path, signatures: dict[Path, list[int] | None] | None = None
+) -> list[ArraySpec]:
     root_meta_path = store_path / "zarr.json"
     if not root_meta_path.exists():
         return []
 
-    root_payload = json.loads(root_meta_path.read_text(encoding="utf-8"))
+    root_payload = _read_json(root_meta_path, signatures)
     if root_payload.get("zarr_format") != 3:
         raise ValueError(f"Only zarr_format=3 is supported: {root_meta_path}")
 
@@ -97,91 +172,327 @@ def _scan_from_consolidated_metadata(store_path: Path) -> list[ArraySpec]:
     return specs
 
 
-def scan_array_specs(store_path: Path) -> list[ArraySpec]:
-    """Return every array spec found in a local Zarr v3 store."""
+def _read_json(path: Path, signatures: dict[Path, list[int] | None] | None = None) -> Any:
+    if signatures is not None:
+        # Stat first, so a rewrite during the read fails the next cache validation.
+        signatures[path] = _stat_signature(path)
+    return json_loads(path.read_bytes())
 
-    specs = _scan_from_consolidated_metadata(store_path)
-    if specs:
-        specs.sort(key=lambda item: item.name)
-        return specs
 
-    specs: list[ArraySpec] = []
-    stack: list[Path] = [store_path]
-    while stack:
-        node_path = stack.pop()
-        if ".xzarrguard" in node_path.parts:
-            continue
+def _child_dir_names(dir_path: str | Path) -> list[str]:
+    with os.scandir(dir_path) as entries:
+        return sorted(
+            entry.name for entry in entries if entry.name != ".xzarrguard" and entry.is_dir()
+        )
 
-        meta_path = node_path / "zarr.json"
-        if not meta_path.exists():
-            continue
 
-        payload = json.loads(meta_path.read_text(encoding="utf-8"))
-        node_type = payload.get("node_type")
-        if node_type == "group":
-            for child in sorted(node_path.iterdir(), reverse=True):
-                if not child.is_dir() or child.name == ".xzarrguard":
+def _iter_zarr_json(
+    store_path: Path,
+    listings: dict[Path, list[str]] | None = None,
+    signatures: dict[Path, list[int] | None] | None = None,
+) -> Iterator[tuple[Path, dict[str, Any]]]:
+    """Yield metadata paths and payloads of all nodes, descending only into groups.
+
+    The hierarchy is walked level by level and every level's metadata files are read
+    concurrently, which hides per-file latency on network filesystems. If ``listings``
+    is given, the child-directory names of every group directory are recorded in it.
+    If ``signatures`` is given, the stat signature of every ``zarr.json`` (None for a
+    child directory without one) is recorded in it, taken before the file is read.
+    """
+
+    root_meta = store_path / "zarr.json"
+    if not root_meta.exists():
+        return
+
+    level: list[Path] = [root_meta]
+    read_json = partial(_read_json, signatures=signatures)
+    with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+        while level:
+            next_level: list[Path] = []
+            for meta_path, payload in zip(level, executor.map(read_json, level), strict=True):
+                yield meta_path, payload
+                if payload.get("node_type") != "group":
                     continue
-                child_meta = child / "zarr.json"
-                if child_meta.exists():
-                    stack.append(child)
-            continue
-        spec = _parse_array_spec(
-            store_path=store_path,
-            array_name="",
-            array_path=meta_path.parent,
-            payload=payload,
-            source=meta_path,
-        )
-        if spec is not None:
-            specs.append(spec)
-    specs.sort(key=lambda item: item.name)
+                group_dir = meta_path.parent
+                children = _child_dir_names(group_dir)
+                if listings is not None:
+                    listings[group_dir] = children
+                for name in children:
+                    child_meta = group_dir / name / "zarr.json"
+                    if child_meta.exists():
+                        next_level.append(child_meta)
+                    elif signatures is not None:
+                        signatures[child_meta] = None
+            level = next_level
+
+
+def _stat_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _sources_match(store_path: Path, sources: _Sources) -> bool:
+    signatures, listings = sources
+    for rel_dir, names in listings.items():
+        # Compared by listing: directory mtimes are unreliable on FUSE/object stores.
+        try:
+            if _child_dir_names(store_path / rel_dir) != names:
+                return False
+        except OSError:
+            return False
+    return all(
+        _stat_signature(store_path / rel_path) == signature
+        for rel_path, signature in signatures.items()
+    )
+
+
+def _load_cached_specs(store_path: Path) -> tuple[_Sources, list[ArraySpec]] | None:
+    cache_path = store_path / SPEC_CACHE_PATH
+    try:
+        payload = json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("schema_version") != SPEC_CACHE_SCHEMA_VERSION:
+        return None
+
+    try:
+        sources = (dict(payload["sources"]), dict(payload["listings"]))
+        if not _sources_match(store_path, sources):
+            return None
+        specs = [
+            ArraySpec(
+                name=str(item["name"]),
+                path=store_path / item["path"],
+                shape=tuple(map(int, item["shape"])),
+                chunk_shape=tuple(map(int, item["chunk_shape"])),
+                chunk_key_encoding=sys.intern(str(item["chunk_key_encoding"])),
+                separator=sys.intern(str(item["separator"])),
+            )
+            for item in payload["specs"]
+        ]
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    return sources, specs
+
+
+def _collect_sources(
+    store_path: Path,
+    listings: dict[Path, list[str]],
+    signatures: dict[Path, list[int] | None],
+) -> _Sources:
+    rel_signatures = {
+        path.relative_to(store_path).as_posix(): signature for path, signature in signatures.items()
+    }
+    rel_listings = {
+        group_dir.relative_to(store_path).as_posix(): names for group_dir, names in listings.items()
+    }
+    return rel_signatures, rel_listings
+
+
+def _write_cached_specs(store_path: Path, specs: list[ArraySpec], sources: _Sources) -> None:
+    cache_path = store_path / SPEC_CACHE_PATH
+    payload = {
+        "schema_version": SPEC_CACHE_SCHEMA_VERSION,
+        "sources": sources[0],
+        "listings": sources[1],
+        "specs": [
+            {
+                "name": spec.name,
+                "path": spec.path.relative_to(store_path).as_posix(),
+                "shape": list(spec.shape),
+                "chunk_shape": list(spec.chunk_shape),
+                "chunk_key_encoding": spec.chunk_key_encoding,
+                "separator": spec.separator,
+            }
+            for spec in specs
+        ],
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(json_dumps(payload))
+    except OSError:
+        # The cache is an optimization only; read-only stores are checked without it.
+        pass
+
+
+def _remember_specs(key: tuple[str, str], sources: _Sources, specs: list[ArraySpec]) -> None:
+    _spec_memo.pop(key, None)
+    _spec_memo[key] = (sources, specs)
+    while len(_spec_memo) > _SPEC_MEMO_SIZE:
+        del _spec_memo[next(iter(_spec_memo))]
+
+
+def scan_array_specs(store_path: Path, *, use_cache: bool = False) -> list[ArraySpec]:
+    """Return every array spec found in a local Zarr v3 store.
+
+    With ``use_cache``, parsed specs are persisted to ``.xzarrguard/specs.cache.json``
+    and kept in memory for the process. They are reused while the mtime and size of
+    every ``zarr.json`` they were read from, the absence of ``zarr.json`` in other
+    child directories of groups, and the child-directory listing of every group are
+    unchanged.
+    """
+
+    memo_key = (os.fspath(store_path), os.path.abspath(store_path))
+    if use_cache:
+        memo = _spec_memo.get(memo_key)
+        if memo is not None and _sources_match(store_path, memo[0]):
+            _remember_specs(memo_key, *memo)
+            return list(memo[1])
+        cached = _load_cached_specs(store_path)
+        if cached is not None:
+            _remember_specs(memo_key, *cached)
+            return list(cached[1])
+
+    listings: dict[Path, list[str]] = {}
+    signatures: dict[Path, list[int] | None] | None = {} if use_cache else None
+    specs = _scan_from_consolidated_metadata(store_path, signatures)
+    if not specs:
+        for meta_path, payload in _iter_zarr_json(store_path, listings, signatures):
+            if payload.get("node_type") == "group":
+                continue
+            spec = _parse_array_spec(
+                store_path=store_path,
+                array_name="",
+                array_path=meta_path.parent,
+                payload=payload,
+                source=meta_path,
+            )
+            if spec is not None:
+                specs.append(spec)
+    specs.sort(key=attrgetter("name"))
+    if signatures is not None and (specs or listings):
+        sources = _collect_sources(store_path, listings, signatures)
+        _write_cached_specs(store_path, specs, sources)
+        _remember_specs(memo_key, sources, list(specs))
     return specs
 
 
 def chunk_counts(spec: ArraySpec) -> tuple[int, ...]:
     """Return number of chunks per dimension."""
 
-    if len(spec.shape) != len(spec.chunk_shape):
-        raise ValueError(f"Shape/chunk rank mismatch for {spec.name}")
-    return tuple(
-        math.ceil(size / chunk) for size, chunk in zip(spec.shape, spec.chunk_shape, strict=True)
-    )
+    return spec.counts
 
 
-def expected_chunk_coords(spec: ArraySpec):
+def expected_chunk_coords(spec: ArraySpec) -> Iterator[tuple[int, ...]]:
     """Yield all expected chunk coordinates."""
 
-    counts = chunk_counts(spec)
-    if not counts:
-        yield ()
-        return
-    for coord in product(*(range(n) for n in counts)):
-        yield tuple(int(v) for v in coord)
+    # product() of no ranges yields the single empty coordinate of a 0-d array.
+    return product(*map(range, spec.counts))
+
+
+def expected_chunk_keys(spec: ArraySpec) -> Iterator[str]:
+    """Yield keys of all expected chunks in the order of :func:`expected_chunk_coords`."""
+
+    head = [["c"]] if spec.chunk_key_encoding == "default" else []
+    if not spec.counts:
+        return iter(["c"] if head else ["0"])
+    digits = [[str(index) for index in range(count)] for count in spec.counts]
+    return map(spec.separator.join, product(*head, *digits))
+
+
+def chunk_coord_from_index(spec: ArraySpec, index: int) -> tuple[int, ...]:
+    """Return the chunk coordinate at a C-order linear chunk index."""
+
+    coord: list[int] = []
+    for count in reversed(spec.counts):
+        index, remainder = divmod(index, count)
+        coord.append(remainder)
+    return tuple(reversed(coord))
 
 
 def coord_in_bounds(spec: ArraySpec, coord: tuple[int, ...]) -> bool:
     """Check whether a chunk coordinate is valid for this array."""
 
-    counts = chunk_counts(spec)
+    counts = spec.counts
     if len(coord) != len(counts):
         return False
-    return all(0 <= index < count for index, count in zip(coord, counts, strict=True))
+    for index, count in zip(coord, counts, strict=True):
+        if index < 0 or index >= count:
+            return False
+    return True
+
+
+def coords_in_bounds(spec: ArraySpec, coords: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`coord_in_bounds` for an ``(n, ndim)`` integer coordinate array."""
+
+    counts = np.asarray(spec.counts, dtype=np.int64)
+    return np.all((coords >= 0) & (coords < counts), axis=1)
 
 
 def chunk_key(spec: ArraySpec, coord: tuple[int, ...]) -> str:
     """Encode chunk coordinates according to Zarr chunk_key_encoding."""
 
+    return spec.encoder(coord)
+
+
+def chunk_keys_bulk(spec: ArraySpec, coords: np.ndarray) -> np.ndarray:
+    """Encode an ``(n_chunks, ndim)`` coordinate array into an object array of chunk keys."""
+
     if spec.chunk_key_encoding == "default":
-        if not coord:
-            return "c"
-        return f"c{spec.separator}" + spec.separator.join(str(v) for v in coord)
-    if spec.chunk_key_encoding == "v2":
-        return "0" if not coord else spec.separator.join(str(v) for v in coord)
-    raise ValueError(f"Unsupported chunk_key_encoding '{spec.chunk_key_encoding}' for {spec.name}")
+        prefix, scalar_key = f"c{spec.separator}", "c"
+    else:
+        prefix, scalar_key = "", "0"
+
+    if coords.shape[1] == 0:
+        return np.full(coords.shape[0], scalar_key, dtype=object)
+    keys = coords[:, 0].astype(str)
+    for dim in range(1, coords.shape[1]):
+        keys = np.char.add(np.char.add(keys, spec.separator), coords[:, dim].astype(str))
+    if prefix:
+        keys = np.char.add(prefix, keys)
+    return keys.astype(object)
+
+
+def chunk_linear_indices(spec: ArraySpec, coords: np.ndarray) -> np.ndarray:
+    """Return the C-order linear chunk index of every row of an in-bounds coordinate array."""
+
+    strides = np.ones(len(spec.counts), dtype=np.int64)
+    for dim in range(len(spec.counts) - 2, -1, -1):
+        strides[dim] = strides[dim + 1] * spec.counts[dim + 1]
+    return coords @ strides
 
 
 def chunk_path(spec: ArraySpec, coord: tuple[int, ...]) -> Path:
     """Return the chunk file path for a coordinate."""
 
     return spec.path / chunk_key(spec, coord)
+
+
+def chunk_fspath(spec: ArraySpec, coord: tuple[int, ...]) -> str:
+    """Return the chunk file path for a coordinate as a string, without building a ``Path``."""
+
+    return f"{spec.fspath}{os.sep}{spec.encoder(coord)}"
+
+
+def scan_existing_chunk_keys(
+    spec: ArraySpec,
+    listed_dirs: list[str] | None = None,
+) -> set[str]:
+    """Return keys of all chunk files present below the array directory.
+
+    If ``listed_dirs`` is given, the path of every directory listed is appended to it.
+    """
+
+    keys: set[str] = set()
+    stack: list[tuple[str, str]] = [(os.fspath(spec.path), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        if listed_dirs is not None:
+            listed_dirs.append(dir_path)
+        try:
+            entries = os.scandir(dir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                if not prefix and entry.name in {"zarr.json", ".xzarrguard"}:
+                    continue
+                key = f"{prefix}{entry.name}"
+                if entry.is_dir():
+                    stack.append((entry.path, f"{key}/"))
+                else:
+                    keys.add(key)
+    return keys
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-import json
+import struct
 from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote
 
+import numpy as np
+
+from ._json import dumps as json_dumps
+from ._json import loads as json_loads
+from .layout import ArraySpec, chunk_keys_bulk
 from .models import ChunkRef
 
 MANIFEST_SCHEMA_VERSION = 1
 MANIFEST_ROOT = Path(".xzarrguard") / "manifests"
+BINARY_MANIFEST_MAGIC = b"XZGM"
+# magic, schema version, ndim, entry count; followed by little-endian int64 coords.
+_BINARY_HEADER = struct.Struct("<4sHHQ")
 
 
 def _normalize_coord(coord: Iterable[int]) -> tuple[int, ...]:
-    return tuple(int(item) for item in coord)
+    return tuple(map(int, coord))
 
 
 def _normalize_mapping(
@@ -25,23 +34,17 @@ def _normalize_mapping(
         return normalized
 
     for variable, coords in mapping.items():
-        parsed = [_normalize_coord(coord) for coord in coords]
-        unique = sorted(set(parsed))
-        normalized[str(variable)] = unique
+        normalized[str(variable)] = sorted({tuple(map(int, coord)) for coord in coords})
     return normalized
 
 
 def load_no_data_chunks(path: str | Path) -> dict[str, list[tuple[int, ...]]]:
     """Load variable->chunk-coordinate mapping from JSON."""
 
-    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    payload = json_loads(Path(path).read_bytes())
     if not isinstance(payload, dict):
         raise ValueError("No-data mapping must be an object")
-    mapping = {
-        str(name): [tuple(int(v) for v in coord) for coord in coords]
-        for name, coords in payload.items()
-    }
-    return _normalize_mapping(mapping)
+    return _normalize_mapping(payload)
 
 
 def dump_no_data_chunks(
@@ -50,32 +53,73 @@ def dump_no_data_chunks(
 ) -> None:
     """Write variable->chunk-coordinate mapping to JSON."""
 
-    normalized = _normalize_mapping(mapping)
-    serializable = {
-        variable: [list(coord) for coord in coords]
-        for variable, coords in sorted(normalized.items(), key=lambda item: item[0])
-    }
-    Path(path).write_text(
-        json.dumps(serializable, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    # Tuples serialize as JSON arrays and the encoder sorts variable names, so
+    # the normalized mapping is written as-is.
+    Path(path).write_bytes(json_dumps(_normalize_mapping(mapping), indent=True))
+
+
+@lru_cache(maxsize=1024)
+def _safe_name(variable: str) -> str:
+    return quote(variable, safe="")
 
 
 def manifest_path(store_path: str | Path, variable: str) -> Path:
     """Return manifest path for one variable."""
 
-    safe_name = quote(variable, safe="")
-    return Path(store_path) / MANIFEST_ROOT / f"{safe_name}.json"
+    return Path(store_path) / MANIFEST_ROOT / f"{_safe_name(variable)}.json"
+
+
+def binary_manifest_path(store_path: str | Path, variable: str) -> Path:
+    """Return binary manifest path for one variable."""
+
+    return manifest_path(store_path, variable).with_suffix(".bin")
+
+
+def _load_binary_manifest(path: Path, spec: ArraySpec) -> list[ChunkRef]:
+    data = path.read_bytes()
+    if len(data) < _BINARY_HEADER.size:
+        raise ValueError(f"Truncated binary manifest: {path}")
+    magic, schema_version, ndim, count = _BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MANIFEST_MAGIC or schema_version != MANIFEST_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported manifest schema in {path}")
+    if len(data) != _BINARY_HEADER.size + count * ndim * 8:
+        raise ValueError(f"Truncated binary manifest: {path}")
+
+    coords = np.frombuffer(data, dtype="<i8", offset=_BINARY_HEADER.size).reshape(count, ndim)
+    if ndim != len(spec.counts):
+        # Keys cannot be derived for a rank mismatch; the placeholder keeps the
+        # entries reportable as out of bounds.
+        return [ChunkRef(coord=tuple(coord), key="") for coord in coords.tolist()]
+    keys = chunk_keys_bulk(spec, coords).tolist()
+    return [
+        ChunkRef(coord=tuple(coord), key=key)
+        for coord, key in zip(coords.tolist(), keys, strict=True)
+    ]
+
+
+def load_variable_manifest(
+    store_path: str | Path,
+    variable: str,
+    *,
+    spec: ArraySpec | None = None,
+) -> tuple[bool, list[ChunkRef]]:
+    """Read a single variable manifest.
 
+    Binary manifests take precedence over JSON ones; their keys are derived from the
+    coordinates, so reading one requires ``spec``.
+    """
 
-def load_variable_manifest(store_path: str | Path, variable: str) -> tuple[bool, list[ChunkRef]]:
-    """Read a single variable manifest."""
+    binary_path = binary_manifest_path(store_path, variable)
+    if binary_path.exists():
+        if spec is None:
+            raise ValueError(f"Reading binary manifest {binary_path} requires the array spec")
+        return True, _load_binary_manifest(binary_path, spec)
 
     path = manifest_path(store_path, variable)
     if not path.exists():
         return False, []
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = json_loads(path.read_bytes())
     if payload.get("schema_version") != MANIFEST_SCHEMA_VERSION:
         raise ValueError(f"Unsupported manifest schema in {path}")
 
@@ -84,6 +128,11 @@ def load_variable_manifest(store_path: str | Path, variable: str) -> tuple[bool,
     return True, refs
 
 
+def _unique_refs(refs: Iterable[ChunkRef]) -> Iterable[ChunkRef]:
+    # ChunkRef is frozen and hashable; dict keys dedupe in first-seen order without sorting.
+    return dict.fromkeys(refs)
+
+
 def write_variable_manifest(
     store_path: str | Path,
     variable: str,
@@ -99,7 +148,34 @@ def write_variable_manifest(
         "schema_version": MANIFEST_SCHEMA_VERSION,
         "zarr_format": zarr_format,
         "variable": variable,
-        "allowed_missing": [{"coord": list(ref.coord), "key": ref.key} for ref in refs],
+        "allowed_missing": [
+            {"coord": list(ref.coord), "key": ref.key} for ref in _unique_refs(refs)
+        ],
     }
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    path.write_bytes(json_dumps(payload, indent=True))
+    binary_manifest_path(store_path, variable).unlink(missing_ok=True)
+    return path
+
+
+def write_variable_manifest_binary(
+    store_path: str | Path,
+    variable: str,
+    refs: Iterable[ChunkRef],
+    *,
+    ndim: int,
+) -> Path:
+    """Write a single variable manifest as a columnar binary file.
+
+    Only coordinates are stored; keys are re-derived from the array metadata on load.
+    """
+
+    coord_list = [ref.coord for ref in _unique_refs(refs)]
+    coords = np.array(coord_list, dtype="<i8").reshape(len(coord_list), ndim)
+    path = binary_manifest_path(store_path, variable)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = _BINARY_HEADER.pack(
+        BINARY_MANIFEST_MAGIC, MANIFEST_SCHEMA_VERSION, ndim, coords.shape[0]
+    )
+    path.write_bytes(header + coords.tobytes())
+    manifest_path(store_path, variable).unlink(missing_ok=True)
     return path
@@ -17,6 +17,11 @@ class ChunkRef:
         return {"coord": list(self.coord), "key": self.key}
 
 
+def _refs_to_dicts(refs: list[ChunkRef]) -> list[dict[str, Any]]:
+    # Inlined ChunkRef.to_dict: reports can hold millions of refs.
+    return [{"coord": list(ref.coord), "key": ref.key} for ref in refs]
+
+
 @dataclass(slots=True)
 class VariableIntegrity:
     """Per-variable integrity results."""
@@ -37,11 +42,11 @@ class VariableIntegrity:
             "ok": self.ok,
             "has_manifest": self.has_manifest,
             "expected_chunks": self.expected_chunks,
-            "missing_unexpected": [item.to_dict() for item in self.missing_unexpected],
-            "missing_allowed": [item.to_dict() for item in self.missing_allowed],
-            "stale_manifest": [item.to_dict() for item in self.stale_manifest],
-            "manifest_key_mismatch": [item.to_dict() for item in self.manifest_key_mismatch],
-            "manifest_out_of_bounds": [item.to_dict() for item in self.manifest_out_of_bounds],
+            "missing_unexpected": _refs_to_dicts(self.missing_unexpected),
+            "missing_allowed": _refs_to_dicts(self.missing_allowed),
+            "stale_manifest": _refs_to_dicts(self.stale_manifest),
+            "manifest_key_mismatch": _refs_to_dicts(self.manifest_key_mismatch),
+            "manifest_out_of_bounds": _refs_to_dicts(self.manifest_out_of_bounds),
         }
 
 
@@ -55,6 +60,7 @@ class IntegrityReport:
     errors: list[str] = field(default_factory=list)
     timing: IntegrityTiming | None = None
     ok: bool = True
+    fast_fail: bool = False
 
     def __bool__(self) -> bool:
         return self.ok
@@ -63,6 +69,7 @@ class IntegrityReport:
         payload = {
             "store_path": self.store_path,
             "strict_stale_manifest": self.strict_stale_manifest,
+            "fast_fail": self.fast_fail,
             "ok": self.ok,
             "errors": list(self.errors),
             "variables": {name: report.to_dict() for name, report in self.variables.items()},
@@ -81,6 +88,7 @@ class VariableTiming:
     chunk_scan_s: float = 0.0
     expected_chunks: int = 0
     missing_chunks: int = 0
+    exists_calls: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -89,12 +97,17 @@ class VariableTiming:
             "chunk_scan_s": self.chunk_scan_s,
             "expected_chunks": self.expected_chunks,
             "missing_chunks": self.missing_chunks,
+            "exists_calls": self.exists_calls,
         }
 
 
 @dataclass(slots=True)
 class IntegrityTiming:
-    """Optional coarse-grained timing information for `check_store`."""
+    """Optional coarse-grained timing information for `check_store`.
+
+    ``exists_calls`` counts the filesystem calls made to find out which chunks exist:
+    one directory listing per directory below each array, not one call per chunk.
+    """
 
     total_s: float = 0.0
     scan_specs_s: float = 0.0
@@ -131,7 +144,6 @@ class CreateReport:
             "ok": self.ok,
             "manifests_written": list(self.manifests_written),
             "removed_chunks": {
-                name: [item.to_dict() for item in refs]
-                for name, refs in self.removed_chunks.items()
+                name: _refs_to_dicts(refs) for name, refs in self.removed_chunks.items()
             },
         }
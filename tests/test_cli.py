@@ -11,8 +11,8 @@ import xarray as xr
 from xzarrguard._version import __version__
 from xzarrguard.cli import main
 from xzarrguard.create import create_store
-from xzarrguard.layout import chunk_path, scan_array_specs
-from xzarrguard.manifest import dump_no_data_chunks
+from xzarrguard.layout import SPEC_CACHE_PATH, chunk_path, scan_array_specs
+from xzarrguard.manifest import binary_manifest_path, dump_no_data_chunks
 
 
 def _dataset() -> xr.Dataset:
@@ -74,6 +74,35 @@ def test_cli_check_exit_code_failure(tmp_path: Path, capsys) -> None:
     assert "FAIL" in out
 
 
+def test_cli_check_writes_spec_cache_only_when_requested(tmp_path: Path, capsys) -> None:
+    store = tmp_path / "store.zarr"
+    create_store(_dataset(), store, no_data_strategy="empty_chunks")
+
+    assert main(["check", str(store)]) == 0
+    assert not (store / SPEC_CACHE_PATH).exists()
+
+    assert main(["check", str(store), "--spec-cache"]) == 0
+    assert (store / SPEC_CACHE_PATH).exists()
+    assert main(["check", str(store), "--spec-cache"]) == 0
+    assert capsys.readouterr().out.count("PASS") == 3
+
+
+def test_cli_check_fast_fail_reports_first_failure_only(tmp_path: Path, capsys) -> None:
+    store = tmp_path / "store.zarr"
+    create_store(_dataset(), store, no_data_strategy="empty_chunks")
+    spec = next(item for item in scan_array_specs(store) if item.name == "var")
+    chunk_path(spec, (0, 0)).unlink()
+    chunk_path(spec, (1, 1)).unlink()
+
+    code = main(["check", str(store), "--fast-fail", "--json"])
+    payload = json.loads(capsys.readouterr().out)
+
+    assert code == 1
+    assert payload["fast_fail"] is True
+    assert list(payload["variables"]) == ["var"]
+    assert len(payload["variables"]["var"]["missing_unexpected"]) == 1
+
+
 def test_cli_check_json_output(tmp_path: Path, capsys) -> None:
     store = tmp_path / "store.zarr"
     create_store(_dataset(), store, no_data_strategy="empty_chunks")
@@ -124,3 +153,32 @@ def test_cli_create_then_check_roundtrip(tmp_path: Path, capsys) -> None:
 
     assert create_code == 0
     assert check_code == 0
+
+
+def test_cli_create_binary_manifest_then_check_roundtrip(tmp_path: Path, capsys) -> None:
+    source = tmp_path / "source.zarr"
+    target = tmp_path / "target.zarr"
+    no_data = tmp_path / "no_data.json"
+
+    _write_source_store(_dataset(), source)
+    dump_no_data_chunks(no_data, {"var": [(0, 0)]})
+
+    create_code = main(
+        [
+            "create",
+            str(source),
+            str(target),
+            "--no-data",
+            str(no_data),
+            "--manifest-format",
+            "binary",
+        ]
+    )
+    _ = capsys.readouterr()
+    check_code = main(["check", str(target), "--json"])
+    payload = json.loads(capsys.readouterr().out)
+
+    assert create_code == 0
+    assert check_code == 0
+    assert binary_manifest_path(target, "var").exists()
+    assert payload["variables"]["var"]["missing_allowed"] == [{"coord": [0, 0], "key": "c/0/0"}]
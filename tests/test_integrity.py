@@ -10,7 +10,11 @@ import xarray as xr
 
 from xzarrguard import check_store, create_store
 from xzarrguard.layout import chunk_key, chunk_path, scan_array_specs
-from xzarrguard.manifest import load_no_data_chunks, write_variable_manifest
+from xzarrguard.manifest import (
+    load_no_data_chunks,
+    load_variable_manifest,
+    write_variable_manifest,
+)
 from xzarrguard.models import ChunkRef
 
 
@@ -63,11 +67,13 @@ def test_check_with_timing_populates_timing_payload(tmp_path: Path) -> None:
 
     assert report.timing is not None
     assert report.timing.total_s >= 0.0
-    expected_exists_calls = sum(item.expected_chunks for item in report.variables.values())
+    expected_exists_calls = sum(item.exists_calls for item in report.timing.variables.values())
     assert report.timing.exists_calls == expected_exists_calls
     assert "var" in report.timing.variables
     var_timing = report.timing.variables["var"]
     assert var_timing.expected_chunks == report.variables["var"].expected_chunks
+    # One listing each for var/, var/c, var/c/0 and var/c/1 rather than one per chunk.
+    assert var_timing.exists_calls == 4
     assert var_timing.chunk_scan_s >= 0.0
     payload = report.to_dict()
     assert payload["timing"]["exists_calls"] == expected_exists_calls
@@ -95,6 +101,24 @@ def test_check_fails_missing_chunk_without_manifest(tmp_path: Path) -> None:
     assert report.variables["var"].missing_unexpected
 
 
+def test_fast_fail_stops_at_first_unexpected_missing_chunk(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    create_store(_dataset(), store, no_data_strategy="empty_chunks")
+    _delete_chunk(store, "var", (0, 1))
+    _delete_chunk(store, "var", (1, 1))
+
+    full = check_store(store)
+    fast = check_store(store, fast_fail=True)
+
+    assert len(full.variables["var"].missing_unexpected) == 2
+    assert not fast.ok
+    assert fast.to_dict()["fast_fail"] is True
+    assert [item.coord for item in fast.variables["var"].missing_unexpected] == [(0, 1)]
+    # Variables are checked in name order and the failing "var" ends the check.
+    assert sorted(full.variables) == ["var", "x", "y"]
+    assert list(fast.variables) == ["var"]
+
+
 def test_check_passes_when_missing_is_manifested(tmp_path: Path) -> None:
     store = tmp_path / "store.zarr"
     create_store(_dataset(), store, no_data_chunks={"var": [(0, 0)]})
@@ -135,6 +159,44 @@ def test_stale_manifest_behavior_strict_and_non_strict(tmp_path: Path) -> None:
     assert not strict.ok
 
 
+def test_invalid_manifest_entries_fail_check(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    create_store(_dataset(), store, no_data_chunks={"var": [(0, 0)]})
+
+    spec = next(item for item in scan_array_specs(store) if item.name == "var")
+    # Beyond 64 bits and not exactly representable as a float.
+    huge = 2**70 + 1
+    write_variable_manifest(
+        store,
+        "var",
+        [
+            ChunkRef(coord=(0, 0), key=chunk_key(spec, (0, 0))),
+            ChunkRef(coord=(1, 0), key="c/0/1"),
+            ChunkRef(coord=(2, 0), key="c/2/0"),
+            ChunkRef(coord=(0,), key="c/0"),
+            ChunkRef(coord=(huge, 0), key="c/huge/0"),
+        ],
+    )
+
+    report = check_store(store)
+    variable = report.variables["var"]
+
+    assert not report.ok
+    assert [item.coord for item in variable.missing_allowed] == [(0, 0)]
+    assert [item.coord for item in variable.manifest_key_mismatch] == [(1, 0)]
+    assert [item.coord for item in variable.manifest_out_of_bounds] == [(2, 0), (0,), (huge, 0)]
+
+
+def test_check_accepts_non_finite_attribute_values(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    ds = _dataset()
+    ds["var"].attrs["valid_min"] = float("nan")
+
+    create_store(ds, store, no_data_chunks={"var": [(0, 0)]})
+
+    assert check_store(store).ok
+
+
 def test_create_manifest_strategy_roundtrip(tmp_path: Path) -> None:
     store = tmp_path / "store.zarr"
 
@@ -151,6 +213,40 @@ def test_create_manifest_strategy_roundtrip(tmp_path: Path) -> None:
     assert check.ok
 
 
+def test_create_binary_manifest_roundtrip(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+
+    report = create_store(
+        _dataset(),
+        store,
+        no_data_chunks={"var": [(0, 1), (1, 0)]},
+        manifest_format="binary",
+    )
+    check = check_store(store)
+
+    assert report.manifests_written[0].endswith(".bin")
+    assert check.ok
+    assert [item.coord for item in check.variables["var"].missing_allowed] == [(0, 1), (1, 0)]
+
+    _delete_chunk(store, "var", (1, 1))
+    assert not check_store(store).ok
+
+    with pytest.raises(ValueError, match="requires the array spec"):
+        load_variable_manifest(store, "var")
+
+
+def test_write_variable_manifest_drops_duplicate_refs(tmp_path: Path) -> None:
+    refs = [ChunkRef((0, 1), "c/0/1"), ChunkRef((1, 0), "c/1/0"), ChunkRef((0, 1), "c/0/1")]
+
+    path = write_variable_manifest(tmp_path, "var", refs)
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["allowed_missing"] == [
+        {"coord": [0, 1], "key": "c/0/1"},
+        {"coord": [1, 0], "key": "c/1/0"},
+    ]
+
+
 def test_create_empty_chunks_strategy_roundtrip(tmp_path: Path) -> None:
     store = tmp_path / "store.zarr"
 
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 import json
+import pickle
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from xzarrguard.layout import scan_array_specs
+from xzarrguard import layout
+from xzarrguard.layout import (
+    SPEC_CACHE_PATH,
+    ArraySpec,
+    chunk_coord_from_index,
+    chunk_counts,
+    chunk_fspath,
+    chunk_key,
+    chunk_keys_bulk,
+    chunk_linear_indices,
+    chunk_path,
+    expected_chunk_coords,
+    expected_chunk_keys,
+    scan_array_specs,
+    scan_existing_chunk_keys,
+)
 
 
 def _write_json(path: Path, payload: dict) -> None:
@@ -34,6 +51,27 @@ def _array_meta(shape: tuple[int, ...], chunk_shape: tuple[int, ...]) -> dict:
     }
 
 
+def _spec(
+    shape: tuple[int, ...],
+    chunk_shape: tuple[int, ...],
+    encoding: str = "default",
+    separator: str = "/",
+) -> ArraySpec:
+    return ArraySpec(
+        name="a",
+        path=Path("store.zarr") / "a",
+        shape=shape,
+        chunk_shape=chunk_shape,
+        chunk_key_encoding=encoding,
+        separator=separator,
+    )
+
+
+def _coords_array(spec: ArraySpec) -> np.ndarray:
+    coords = list(expected_chunk_coords(spec))
+    return np.array(coords, dtype=np.int64).reshape(len(coords), len(spec.shape))
+
+
 def test_scan_array_specs_discovers_nested_arrays_without_scanning_chunks(tmp_path: Path) -> None:
     store = tmp_path / "store.zarr"
     _write_json(store / "zarr.json", _group_meta())
@@ -56,6 +94,16 @@ def test_scan_array_specs_rejects_non_v3_root(tmp_path: Path) -> None:
         scan_array_specs(store)
 
 
+def test_scan_array_specs_rejects_unknown_chunk_key_encoding(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    payload = _array_meta((4,), (2,))
+    payload["chunk_key_encoding"] = {"name": "custom"}
+    _write_json(store / "zarr.json", payload)
+
+    with pytest.raises(ValueError, match="Unsupported chunk_key_encoding"):
+        scan_array_specs(store)
+
+
 def test_scan_array_specs_supports_consolidated_metadata_without_child_files(
     tmp_path: Path,
 ) -> None:
@@ -93,3 +141,158 @@ def test_scan_array_specs_prefers_consolidated_metadata_when_available(tmp_path:
     specs = scan_array_specs(store)
 
     assert [item.name for item in specs] == ["a"]
+
+
+def test_scan_existing_chunk_keys_lists_nested_chunk_files(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    _write_json(store / "zarr.json", _array_meta((4, 4), (2, 2)))
+    for key in ("c/0/0", "c/1/1"):
+        (store / key).parent.mkdir(parents=True, exist_ok=True)
+        (store / key).write_bytes(b"0")
+    _write_json(store / ".xzarrguard" / "manifests" / "a.json", {})
+
+    (spec,) = scan_array_specs(store)
+
+    assert scan_existing_chunk_keys(spec) == {"c/0/0", "c/1/1"}
+
+
+def test_scan_array_specs_reuses_cache_until_metadata_changes(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    _write_json(store / "zarr.json", _group_meta())
+    _write_json(store / "a" / "zarr.json", _array_meta((4,), (2,)))
+
+    first = scan_array_specs(store, use_cache=True)
+    assert (store / SPEC_CACHE_PATH).exists()
+    assert scan_array_specs(store, use_cache=True) == first
+
+    _write_json(store / "a" / "zarr.json", _array_meta((16,), (2,)))
+    _write_json(store / "b" / "zarr.json", _array_meta((8,), (4,)))
+
+    specs = scan_array_specs(store, use_cache=True)
+    assert [item.name for item in specs] == ["a", "b"]
+    assert specs[0].shape == (16,)
+
+
+@pytest.mark.parametrize("clear_memo", [False, True])
+def test_scan_array_specs_cache_sees_metadata_added_to_existing_directory(
+    tmp_path: Path, clear_memo: bool
+) -> None:
+    store = tmp_path / "store.zarr"
+    _write_json(store / "zarr.json", _group_meta())
+    _write_json(store / "a" / "zarr.json", _array_meta((4,), (2,)))
+    (store / "b").mkdir()
+
+    assert [item.name for item in scan_array_specs(store, use_cache=True)] == ["a"]
+    _write_json(store / "b" / "zarr.json", _array_meta((8,), (4,)))
+    if clear_memo:
+        layout._spec_memo.clear()
+
+    assert [item.name for item in scan_array_specs(store, use_cache=True)] == ["a", "b"]
+
+
+def test_scan_array_specs_cache_sees_metadata_rewritten_during_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = tmp_path / "store.zarr"
+    _write_json(store / "zarr.json", _group_meta())
+    _write_json(store / "a" / "zarr.json", _array_meta((4,), (2,)))
+    json_loads = layout.json_loads
+
+    def loads_then_rewrite(data: bytes) -> dict:
+        payload = json_loads(data)
+        if payload.get("shape") == [4]:
+            _write_json(store / "a" / "zarr.json", _array_meta((16,), (2,)))
+        return payload
+
+    monkeypatch.setattr(layout, "json_loads", loads_then_rewrite)
+    assert scan_array_specs(store, use_cache=True)[0].shape == (4,)
+    monkeypatch.undo()
+
+    assert scan_array_specs(store, use_cache=True)[0].shape == (16,)
+
+
+def test_scan_array_specs_memo_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stores = [tmp_path / name for name in ("a.zarr", "b.zarr", "c.zarr")]
+    for store in stores:
+        _write_json(store / "zarr.json", _group_meta())
+        _write_json(store / "a" / "zarr.json", _array_meta((4,), (2,)))
+    monkeypatch.setattr(layout, "_SPEC_MEMO_SIZE", 2)
+    monkeypatch.setattr(layout, "_spec_memo", {})
+
+    for store in (stores[0], stores[1], stores[0], stores[2]):
+        scan_array_specs(store, use_cache=True)
+
+    assert [key[0] for key in layout._spec_memo] == [str(stores[0]), str(stores[2])]
+
+
+def test_scan_array_specs_without_cache_leaves_store_untouched(tmp_path: Path) -> None:
+    store = tmp_path / "store.zarr"
+    _write_json(store / "zarr.json", _group_meta())
+    _write_json(store / "a" / "zarr.json", _array_meta((4,), (2,)))
+
+    specs = scan_array_specs(store)
+
+    assert [item.name for item in specs] == ["a"]
+    assert not (store / SPEC_CACHE_PATH).exists()
+
+
+@pytest.mark.parametrize(
+    ("encoding", "separator", "shape"),
+    [("default", "/", (4, 6, 2)), ("default", ".", ()), ("v2", ".", (3, 2)), ("v2", "/", ())],
+)
+def test_expected_chunk_keys_and_coords_follow_expected_order(
+    encoding: str, separator: str, shape: tuple[int, ...]
+) -> None:
+    spec = _spec(shape, tuple(1 for _ in shape), encoding, separator)
+    coords = list(expected_chunk_coords(spec))
+
+    assert list(expected_chunk_keys(spec)) == [chunk_key(spec, coord) for coord in coords]
+    assert [chunk_key(spec, list(coord)) for coord in coords] == list(expected_chunk_keys(spec))
+    assert [chunk_coord_from_index(spec, index) for index in range(len(coords))] == coords
+
+
+@pytest.mark.parametrize(
+    ("encoding", "separator", "shape"),
+    [("default", "/", (4, 6)), ("default", ".", (4, 6)), ("v2", ".", (3,)), ("v2", "/", ())],
+)
+def test_chunk_keys_bulk_matches_chunk_key(
+    encoding: str, separator: str, shape: tuple[int, ...]
+) -> None:
+    spec = _spec(shape, tuple(1 for _ in shape), encoding, separator)
+    coords = _coords_array(spec)
+
+    keys = chunk_keys_bulk(spec, coords).tolist()
+
+    assert keys == [chunk_key(spec, tuple(row)) for row in coords.tolist()]
+
+
+def test_chunk_counts_are_exact_beyond_float_precision() -> None:
+    spec = _spec((2**53 + 1, 10), (1, 3))
+
+    assert chunk_counts(spec) == (2**53 + 1, 4)
+
+
+def test_chunk_fspath_matches_chunk_path() -> None:
+    spec = _spec((4, 6), (2, 3))
+
+    assert Path(chunk_fspath(spec, (1, 0))) == chunk_path(spec, (1, 0))
+
+
+@pytest.mark.parametrize(("encoding", "separator"), [("default", "/"), ("v2", ".")])
+def test_array_spec_pickle_roundtrip(encoding: str, separator: str) -> None:
+    spec = _spec((4, 6), (2, 3), encoding, separator)
+
+    restored = pickle.loads(pickle.dumps(spec))
+
+    assert restored == spec
+    assert restored.counts == spec.counts
+    assert chunk_key(restored, (1, 0)) == chunk_key(spec, (1, 0))
+
+
+def test_chunk_linear_indices_follow_expected_coord_order() -> None:
+    spec = _spec((5, 4, 3), (2, 2, 1))
+    coords = _coords_array(spec)
+
+    assert chunk_linear_indices(spec, coords).tolist() == list(range(len(coords)))